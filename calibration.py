@@ -5,6 +5,7 @@
 import numpy as np
 import cv2
 from typing import Optional, Tuple, List
+import threading
 import json
 import os
 
@@ -25,7 +26,12 @@ class CameraCalibration:
         self.camera1_distortion = None  # 相机1畸变参数
         self.camera2_matrix = None  # 相机2内参矩阵
         self.camera2_distortion = None  # 相机2畸变参数
-        
+
+        # 棋盘格世界坐标缓存（按棋盘参数复用，免去每次标定重建mgrid）
+        self._objp_cache = {}
+        # 单应性矩阵缓存（按全部输入的字节串为键；外参也在键里，重新标定后自然失效）
+        self._homography_cache = {}
+
     def load_calibration(self, file_path: Optional[str] = None) -> bool:
         """
         从文件加载标定参数
@@ -104,18 +110,73 @@ class CameraCalibration:
             print(f"保存标定参数失败: {e}")
             return False
     
+    def _get_objp(self, pattern_size: Tuple[int, int], square_size: float) -> np.ndarray:
+        """
+        获取棋盘格角点的世界坐标（3D对象点）
+
+        按(cols, rows, square_size)缓存，同一棋盘参数下重复标定直接复用
+        同一块连续数组。
+
+        Args:
+            pattern_size: 棋盘格内部角点数量 (cols, rows)
+            square_size: 棋盘格方格的实际尺寸
+
+        Returns:
+            np.ndarray: (cols*rows, 3) float32数组
+        """
+        key = (pattern_size[0], pattern_size[1], square_size)
+        objp = self._objp_cache.get(key)
+        if objp is None:
+            objp = np.zeros((pattern_size[0] * pattern_size[1], 3), np.float32)
+            objp[:, :2] = np.mgrid[0:pattern_size[0], 0:pattern_size[1]].T.reshape(-1, 2)
+            objp *= square_size  # 转换为实际尺寸
+            self._objp_cache[key] = objp
+        return objp
+
+    @staticmethod
+    def _find_chessboard_bounded(gray: np.ndarray,
+                                 pattern_size: Tuple[int, int],
+                                 flags: int,
+                                 timeout: Optional[float]) -> Tuple[bool, Optional[np.ndarray]]:
+        """带超时保护地执行findChessboardCorners
+
+        坏帧可能让检测器在自适应阈值+轮廓分析中运行极久，设置timeout后
+        在独立线程中执行并施加硬截止；超时即放弃本次尝试（已启动的检测
+        在后台跑完，结果被丢弃）。timeout为None时直接调用。
+        """
+        if timeout is None:
+            return cv2.findChessboardCorners(gray, pattern_size, flags=flags)
+
+        # 用daemon线程承载检测：超时后失控的检测线程不会阻塞进程退出
+        # （非daemon的线程池worker会在atexit时被join，恰好卡死在坏帧场景）
+        result = [None]
+
+        def _worker():
+            result[0] = cv2.findChessboardCorners(gray, pattern_size, flags=flags)
+
+        thread = threading.Thread(target=_worker, daemon=True)
+        thread.start()
+        thread.join(timeout)
+        if result[0] is None:
+            if thread.is_alive():
+                print(f"棋盘格检测超时（>{timeout}s），放弃本次尝试")
+            return False, None
+        return result[0]
+
     def detect_chessboard(self,
                          image: np.ndarray,
                          pattern_size: Tuple[int, int],
-                         use_preprocessing: bool = True) -> Tuple[bool, Optional[np.ndarray]]:
+                         use_preprocessing: bool = True,
+                         timeout: Optional[float] = None) -> Tuple[bool, Optional[np.ndarray]]:
         """
         检测图像中的棋盘格角点
-        
+
         Args:
             image: 输入图像
             pattern_size: 棋盘格内部角点数量 (cols, rows)，例如 (9, 6) 表示9列6行
             use_preprocessing: 如果初始检测失败，是否尝试预处理方法
-            
+            timeout: 单次检测的超时时间（秒），None表示不限制
+
         Returns:
             Tuple[bool, np.ndarray]: (是否检测成功, 角点坐标)
         """
@@ -128,9 +189,19 @@ class CameraCalibration:
         # 检测标志：移除CALIB_CB_FAST_CHECK，因为它在模糊或低对比度图像上容易失败
         # 先尝试使用自适应阈值和归一化（不包含快速检查）
         flags = cv2.CALIB_CB_ADAPTIVE_THRESH + cv2.CALIB_CB_NORMALIZE_IMAGE
-        
-        ret, corners = cv2.findChessboardCorners(gray, pattern_size, flags=flags)
-        
+
+        # 大图先降采样再检测（自适应阈值+轮廓分析的开销随面积超线性增长），
+        # 检测成功后把角点放大回原分辨率，由全分辨率上的亚像素优化恢复精度
+        detect_scale = min(1.0, 1280.0 / gray.shape[1])
+        if detect_scale < 1.0:
+            detect_gray = cv2.resize(gray, None, fx=detect_scale, fy=detect_scale,
+                                     interpolation=cv2.INTER_AREA)
+        else:
+            detect_gray = gray
+
+        refine_gray = gray
+        ret, corners = self._find_chessboard_bounded(detect_gray, pattern_size, flags, timeout)
+
         # 如果初始检测失败且允许预处理，尝试预处理方法
         if not ret and use_preprocessing:
             preprocessing_methods = [
@@ -141,22 +212,24 @@ class CameraCalibration:
                 # 方法3: 锐化
                 lambda img: cv2.filter2D(img, -1, np.array([[-1, -1, -1], [-1, 9, -1], [-1, -1, -1]])),
             ]
-            
+
             for i, preprocess_func in enumerate(preprocessing_methods):
                 try:
-                    processed_gray = preprocess_func(gray)
-                    ret, corners = cv2.findChessboardCorners(processed_gray, pattern_size, flags=flags)
+                    processed_gray = preprocess_func(detect_gray)
+                    ret, corners = self._find_chessboard_bounded(processed_gray, pattern_size, flags, timeout)
                     if ret:
-                        # 使用预处理后的图像进行亚像素优化
-                        gray = processed_gray
+                        # 亚像素优化也要在同样预处理过的全分辨率图像上进行
+                        refine_gray = preprocess_func(gray) if detect_scale < 1.0 else processed_gray
                         break
                 except Exception:
                     continue
-        
+
         if ret:
-            # 亚像素精度优化
+            # 放大回原分辨率坐标后做亚像素精度优化
+            if detect_scale < 1.0:
+                corners = corners / np.float32(detect_scale)
             criteria = (cv2.TERM_CRITERIA_EPS + cv2.TERM_CRITERIA_MAX_ITER, 30, 0.001)
-            corners = cv2.cornerSubPix(gray, corners, (11, 11), (-1, -1), criteria)
+            corners = cv2.cornerSubPix(refine_gray, corners, (11, 11), (-1, -1), criteria)
             return True, corners
         else:
             return False, None
@@ -196,11 +269,9 @@ class CameraCalibration:
         if not ret2:
             return False, "相机2图像中未检测到棋盘格"
         
-        # 生成3D对象点（棋盘格角点的世界坐标）
-        objp = np.zeros((pattern_size[0] * pattern_size[1], 3), np.float32)
-        objp[:, :2] = np.mgrid[0:pattern_size[0], 0:pattern_size[1]].T.reshape(-1, 2)
-        objp *= square_size  # 转换为实际尺寸
-        
+        # 生成3D对象点（棋盘格角点的世界坐标，带缓存）
+        objp = self._get_objp(pattern_size, square_size)
+
         # 准备数据
         objpoints = [objp]
         imgpoints1 = [corners1]
@@ -436,10 +507,8 @@ class CameraCalibration:
         if camera1_matrix is None or camera2_matrix is None:
             return False, "需要两个相机的内参矩阵"
         
-        # 生成3D对象点
-        objp = np.zeros((pattern_size[0] * pattern_size[1], 3), np.float32)
-        objp[:, :2] = np.mgrid[0:pattern_size[0], 0:pattern_size[1]].T.reshape(-1, 2)
-        objp *= square_size
+        # 生成3D对象点（带缓存）
+        objp = self._get_objp(pattern_size, square_size)
         
         objpoints = []
         imgpoints1 = []
@@ -605,7 +674,107 @@ class CameraCalibration:
             traceback.print_exc()
             return None
     
-    def transform_point(self, 
+    def transform_points_batch(self,
+                               points: np.ndarray,
+                               camera1_matrix: np.ndarray,
+                               camera2_matrix: np.ndarray,
+                               camera1_distortion: Optional[np.ndarray] = None,
+                               camera2_distortion: Optional[np.ndarray] = None,
+                               depths: Optional[np.ndarray] = None) -> Optional[list]:
+        """
+        批量版的transform_point_with_projectpoints：一次undistortPoints/projectPoints
+        调用转换N个点，避免逐点的Python往返和重复的矩阵准备
+
+        Args:
+            points: 相机1图像中的点坐标，形状 (N, 2)
+            camera1_matrix: 相机1的内参矩阵 (3, 3)
+            camera2_matrix: 相机2的内参矩阵 (3, 3)
+            camera1_distortion: 相机1的畸变参数，可选
+            camera2_distortion: 相机2的畸变参数，可选
+            depths: 各点的深度值（单位：毫米），形状 (N,)
+
+        Returns:
+            list: 长度N的列表，每项为相机2图像坐标 (x, y) 的np.ndarray，
+                位于相机2后方的点为None；整体失败返回None
+        """
+        if self.extrinsic_matrix is None:
+            print("外参矩阵未标定")
+            return None
+
+        if depths is None:
+            print("错误: 需要深度信息才能进行坐标转换")
+            return None
+
+        try:
+            pts = np.asarray(points, dtype=np.float32).reshape(-1, 2)
+            depth_arr = np.asarray(depths, dtype=np.float32).reshape(-1)
+            if len(pts) != len(depth_arr):
+                print(f"错误: 点数({len(pts)})与深度数({len(depth_arr)})不一致")
+                return None
+            if np.any(depth_arr <= 0):
+                print("错误: 深度值必须大于0")
+                return None
+
+            # 1. 批量去畸变，得到归一化坐标
+            if camera1_distortion is not None:
+                camera1_distortion = np.asarray(camera1_distortion, dtype=np.float32)
+
+            if camera1_distortion is not None and len(camera1_distortion) > 0 and np.any(camera1_distortion != 0):
+                normalized = cv2.undistortPoints(
+                    pts.reshape(-1, 1, 2), camera1_matrix, camera1_distortion, P=None
+                ).reshape(-1, 2)
+            else:
+                fx1, fy1 = camera1_matrix[0, 0], camera1_matrix[1, 1]
+                cx1, cy1 = camera1_matrix[0, 2], camera1_matrix[1, 2]
+                normalized = np.empty_like(pts)
+                normalized[:, 0] = (pts[:, 0] - cx1) / fx1
+                normalized[:, 1] = (pts[:, 1] - cy1) / fy1
+
+            # 2. 按深度抬升为相机1坐标系3D点，再用外参一次性转换到相机2坐标系
+            points_3d_cam1 = np.empty((len(pts), 3), dtype=np.float64)
+            points_3d_cam1[:, 0] = normalized[:, 0] * depth_arr
+            points_3d_cam1[:, 1] = normalized[:, 1] * depth_arr
+            points_3d_cam1[:, 2] = depth_arr
+
+            R = self.extrinsic_matrix[:3, :3]
+            t = self.extrinsic_matrix[:3, 3]
+            points_3d_cam2 = points_3d_cam1 @ R.T + t
+
+            in_front = points_3d_cam2[:, 2] > 0
+            if not np.all(in_front):
+                print(f"警告: {int(np.count_nonzero(~in_front))}个点在相机2后方，无法投影")
+
+            results = [None] * len(pts)
+            if not np.any(in_front):
+                return results
+
+            # 3. 一次projectPoints投影所有位于相机2前方的点（与标定一致，含畸变）
+            rvec = np.zeros((3, 1), dtype=np.float32)
+            tvec = np.zeros((3, 1), dtype=np.float32)
+
+            if camera2_distortion is not None:
+                dist_coeffs = np.asarray(camera2_distortion, dtype=np.float32).reshape(-1)
+            else:
+                dist_coeffs = np.zeros(4, dtype=np.float32)
+
+            projected_points, _ = cv2.projectPoints(
+                points_3d_cam2[in_front].reshape(-1, 1, 3).astype(np.float32),
+                rvec, tvec,
+                camera2_matrix,
+                dist_coeffs
+            )
+            projected = projected_points.reshape(-1, 2)
+            for j, idx in enumerate(np.flatnonzero(in_front)):
+                results[idx] = projected[j]
+
+            return results
+        except Exception as e:
+            print(f"批量坐标转换失败: {e}")
+            import traceback
+            traceback.print_exc()
+            return None
+
+    def transform_point(self,
                        point: np.ndarray,
                        camera1_matrix: np.ndarray,
                        camera2_matrix: np.ndarray,
@@ -781,7 +950,20 @@ class CameraCalibration:
         if self.extrinsic_matrix is None:
             print("外参矩阵未标定")
             return None
-        
+
+        # 输入在两次转换测试之间基本不变，按输入内容缓存结果，
+        # 避免重复的求逆/矩阵乘（外参包含在键里，重新标定后自然失效）
+        cache_key = (
+            np.asarray(camera1_matrix, dtype=np.float64).tobytes(),
+            np.asarray(camera2_matrix, dtype=np.float64).tobytes(),
+            np.asarray(self.extrinsic_matrix, dtype=np.float64).tobytes(),
+            float(plane_depth),
+            None if plane_normal is None else np.asarray(plane_normal, dtype=np.float64).tobytes(),
+        )
+        cached = self._homography_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             # 如果未指定平面法向量，假设平面垂直于相机1的光轴（z轴）
             if plane_normal is None:
@@ -858,7 +1040,8 @@ class CameraCalibration:
             cond_num = np.linalg.cond(H)
             if cond_num > 1e10:
                 print(f"警告: 单应性矩阵条件数很大 ({cond_num:.2e})，可能导致数值不稳定")
-            
+
+            self._homography_cache[cache_key] = H
             return H
         except Exception as e:
             print(f"计算单应性矩阵失败: {e}")
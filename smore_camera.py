@@ -10,6 +10,7 @@ from ctypes import (
     CDLL,
     POINTER,
     Structure,
+    addressof,
     byref,
     c_bool,
     c_char_p,
@@ -180,6 +181,11 @@ class SmoreCamera:
         self.handle = c_uint32()
         self.connected = False
         self._dll = _load_dll(dll_path)
+        # 预分配的BGR输出缓冲区（按分辨率复用，避免每帧重新分配）
+        self._bgr_buffer: Optional[np.ndarray] = None
+        # 缓存的ctypes数组类型（按缓冲区大小复用，分辨率固定后只构造一次）
+        self._src_type = None
+        self._src_size = 0
 
     def connect(self) -> bool:
         """连接相机"""
@@ -206,6 +212,29 @@ class SmoreCamera:
         print("相机未连接，尝试重新连接...")
         return self.connect()
 
+    def _wrap_frame_buffer(self, pointer, buffer_size: int) -> np.ndarray:
+        """把SDK缓冲区指针零拷贝包装为一维uint8数组
+
+        np.ctypeslib.as_array每次调用都要临时构造带__array_interface__的
+        ctypes类型，这里按缓冲区大小缓存该类型，from_address + frombuffer
+        是最快的零拷贝包装路径。
+        """
+        if self._src_size != buffer_size:
+            self._src_type = c_ubyte * buffer_size
+            self._src_size = buffer_size
+        return np.frombuffer(
+            self._src_type.from_address(addressof(pointer.contents)),
+            dtype=np.uint8,
+        )
+
+    def _get_bgr_buffer(self, height: int, width: int) -> np.ndarray:
+        """获取预分配的BGR输出缓冲区（分辨率变化时重新分配）"""
+        buffer = self._bgr_buffer
+        if buffer is None or buffer.shape[0] != height or buffer.shape[1] != width:
+            buffer = np.empty((height, width, 3), dtype=np.uint8)
+            self._bgr_buffer = buffer
+        return buffer
+
     def _frame_to_bgr(self, frame_buffer: smFrameBuffer) -> Optional[np.ndarray]:
         if frame_buffer is None:
             return None
@@ -217,30 +246,49 @@ class SmoreCamera:
         if width <= 0 or height <= 0:
             return None
 
-        # if frame_buffer.pBufferRGB:
-        #     buffer_size = width * height * 3
-        #     rgb_flat = np.ctypeslib.as_array(frame_buffer.pBufferRGB, shape=(buffer_size,))
-        #     if rgb_flat.size == 0:
-        #         return None
-        #     rgb_image = rgb_flat.reshape((height, width, 3))
-        #     return cv2.cvtColor(rgb_image, cv2.COLOR_RGB2BGR)
+        # 优先使用SDK已转换好的RGB缓冲区：零拷贝包装后直接转到预分配的BGR缓冲区，
+        # cvtColor的dst参数避免OpenCV内部再分配一块HxWx3内存
+        if frame_buffer.pBufferRGB:
+            buffer_size = width * height * 3
+            rgb_flat = self._wrap_frame_buffer(frame_buffer.pBufferRGB, buffer_size)
+            rgb_image = rgb_flat.reshape((height, width, 3))
+            bgr_image = self._get_bgr_buffer(height, width)
+            cv2.cvtColor(rgb_image, cv2.COLOR_RGB2BGR, dst=bgr_image)
+            return bgr_image
 
         if frame_buffer.pBuffer:
-            buffer_size = width * height * max(1, channels)
-            raw_flat = np.ctypeslib.as_array(frame_buffer.pBuffer, shape=(buffer_size,))
-            if raw_flat.size == 0:
+            # 只接受已知的通道数，避免channels==0被当作灰度图送入cvtColor导致断言崩溃
+            if channels not in (1, 3, 4):
+                print(f"不支持的图像通道数: {channels}")
                 return None
-            raw_image = raw_flat.reshape((height, width, max(1, channels)))
+            buffer_size = width * height * channels
+            raw_flat = self._wrap_frame_buffer(frame_buffer.pBuffer, buffer_size)
+            raw_image = raw_flat.reshape((height, width, channels))
+            bgr_image = self._get_bgr_buffer(height, width)
             if channels == 1:
-                return cv2.cvtColor(raw_image, cv2.COLOR_GRAY2BGR)
-            return raw_image.copy()
+                cv2.cvtColor(raw_image, cv2.COLOR_GRAY2BGR, dst=bgr_image)
+            elif channels == 4:
+                cv2.cvtColor(raw_image, cv2.COLOR_BGRA2BGR, dst=bgr_image)
+            else:
+                # 已经是BGR，拷出SDK缓冲区即可（smReleaseFrame后SDK内存失效）
+                np.copyto(bgr_image, raw_image)
+            return bgr_image
 
         return None
 
     def _capture_frame(self, max_retries: int, retry_delay: float) -> Optional[np.ndarray]:
+        # 重试循环内的ctypes属性查找/byref构造开销可观，提前绑定为局部变量，
+        # 每次尝试只剩下纯粹的DLL调用本身
+        send_transmit = self._dll.smSendTransmit
+        get_frame_result = self._dll.smGetFrameResult
+        release_frame = self._dll.smReleaseFrame
+        handle_ref = byref(self.handle)
+        run_once = smTransmit.MainRunOnce.value
+        sm_ok = ErrorCode.SM_OK.value
+
         for attempt in range(max_retries):
-            ret = self._dll.smSendTransmit(byref(self.handle), smTransmit.MainRunOnce.value)
-            if ret != ErrorCode.SM_OK.value:
+            ret = send_transmit(handle_ref, run_once)
+            if ret != sm_ok:
                 if attempt < max_retries - 1:
                     time.sleep(retry_delay)
                     continue
@@ -249,12 +297,12 @@ class SmoreCamera:
             frame_buffer = POINTER(smFrameBuffer)()
             project_result = POINTER(smProjectResult)()
             try:
-                ret = self._dll.smGetFrameResult(
-                    byref(self.handle),
+                ret = get_frame_result(
+                    handle_ref,
                     byref(frame_buffer),
                     byref(project_result),
                 )
-                if ret != ErrorCode.SM_OK.value:
+                if ret != sm_ok:
                     if attempt < max_retries - 1:
                         time.sleep(retry_delay)
                         continue
@@ -268,7 +316,7 @@ class SmoreCamera:
                     return None
                 return image
             finally:
-                self._dll.smReleaseFrame(byref(self.handle))
+                release_frame(handle_ref)
         return None
 
     def capture_image(
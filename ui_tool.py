@@ -10,9 +10,11 @@ from PIL import Image, ImageTk
 import time
 import os
 from typing import Optional, Tuple, List
+import collections
 import paramiko
 import json
 import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from epiceye_camera import EpicEyeCamera
 from smore_camera import SmoreCamera
@@ -27,6 +29,40 @@ DEVICE_CONFIG_NAME = "transfer_smore_calib.json"
 DEVICE_BASE_DIR = "/usr/scanner"
 UI_CONFIG_FILE = "ui_config.json"  # UI配置文件名
 
+# SFTP单次读写请求大小。paramiko默认32KB，在有延迟的链路上吞吐受限；
+# OpenSSH服务端支持到256KB，128KB对大文件（如深度图npy）有明显提升
+paramiko.sftp_file.SFTPFile.MAX_REQUEST_SIZE = 128 * 1024
+
+# 四个选择点的标签（左上、右上、左下、右下）
+POINT_LABELS = ("TL", "TR", "BL", "BR")  # Top-Left, Top-Right, Bottom-Left, Bottom-Right
+POINT_LABELS_CN = ("左上", "右上", "左下", "右下")  # 用于日志显示
+POINT_COLORS = ((0, 255, 0), (255, 0, 0), (0, 0, 255), (255, 255, 0))  # 绿、蓝、红、青（BGR）
+
+# 坐标转换相关的长错误文案（导入时构建一次，错误路径只做字典查找）
+ERROR_MSGS = {
+    "no_depth_no_input": (
+        "无法进行3D坐标转换：\n\n"
+        "1. 未获取深度图\n"
+        "2. 未输入深度值\n\n"
+        "请在UI中输入深度值（mm）后重试，或连接3D相机获取深度图。"
+    ),
+    "invalid_depth": "深度值格式错误或小于等于0，请输入有效的深度值（mm）。",
+    "no_3d_image": (
+        "无法进行坐标转换：\n\n"
+        "1. 3D相机未连接，无法获取深度值\n"
+        "2. 没有加载3D相机图像\n\n"
+        "请连接3D相机并获取深度图，或加载3D相机图像后输入深度值。"
+    ),
+    "transform_failed": (
+        "坐标转换失败\n\n可能原因：\n"
+        "1. 深度图无效\n"
+        "2. 某些点的深度值无效\n"
+        "3. 转换后的点在相机后方\n"
+        "4. 有效转换点不足（需要至少2个）\n\n"
+        "请查看终端输出获取详细错误信息"
+    ),
+}
+
 
 class CameraCalibrationUI:
     """相机标定UI工具主类"""
@@ -84,6 +120,19 @@ class CameraCalibrationUI:
         self.depth_map: Optional[np.ndarray] = None  # 3D相机的深度图
         self.saved_depth_map: Optional[np.ndarray] = None  # 标定时保存的深度图
         self.transformed_roi: Optional[Tuple[int, int, int, int]] = None  # 转换后的ROI
+        self._overlay_3d_key = None  # 3D显示图缓存键（图像id + 点集），变化时才重绘
+        # 重绘合并标记：一个idle周期内的多次显示更新请求只触发一次实际重绘
+        self._redraw_pending_3d = False
+        self._redraw_pending_barcode = False
+        # 跨画布重绘合并：一次flush里按需刷新两个画布（见_schedule_redraw）
+        self._pending_redraw = {}
+        self._redraw_scheduled = False
+        self._display_buffer_3d: Optional[np.ndarray] = None  # 预分配的3D显示缓冲区
+        self._display_buffer_barcode: Optional[np.ndarray] = None  # 预分配的读码器标注显示缓冲区
+        # 超大原图的显示预览缓存（按来源图像对象各存一份，见_get_ingest_preview）
+        self._preview_cache = {}
+        # 四个选择点的颜色（BGR），构造一次供各绘制路径复用
+        self._point_colors = np.array(POINT_COLORS, dtype=np.uint8)
         
         # 四个点选择相关（左上、右上、左下、右下）
         self.selected_points: List[Optional[Tuple[int, int]]] = [None, None, None, None]  # 四个点：左上、右上、左下、右下
@@ -97,6 +146,42 @@ class CameraCalibrationUI:
         # 检测线程相关
         self.detection_thread: Optional[threading.Thread] = None
         self.detection_cancel_flag = threading.Event()
+
+        # 本地图像加载线程池（后台解码，避免大图阻塞Tk主线程）
+        self.image_load_executor = ThreadPoolExecutor(max_workers=1)
+
+        # 深度图后台采集线程池（标定完成后的相机往返不占用Tk主线程）
+        self._capture_executor = ThreadPoolExecutor(max_workers=1)
+
+        # UI配置延迟保存定时器
+        self._save_config_timer = None
+
+        # 日志缓冲（idle时合批刷入文本框）
+        self._log_queue = collections.deque()
+        self._log_flush_scheduled = False
+        # 日志时间戳缓存（同一秒内的连续日志复用格式化结果）
+        self._last_ts_sec = 0
+        self._last_ts_str = ''
+
+        # 内参矩阵规范化结果缓存（按源对象id记忆，避免每次调用重复list->ndarray->reshape）
+        self._intrinsics_cache = {}
+
+        # 批量模式：开启后_notify不再弹出任何非错误对话框（供脚本化/连续操作使用）
+        self.batch_mode = False
+
+        # 标记绘制样式缓存（线宽/点半径按图像分辨率计算，同分辨率下复用）
+        self._style_cache = {}
+        # 点标记预渲染贴片缓存（按半径+颜色复用，见_get_point_sprite）
+        self._sprite_cache = {}
+        # 点标签文本贴片缓存（标签和字体固定，按标签+颜色只光栅化一次）
+        self._label_sprite_cache = {}
+
+        # 复用的设备SSH连接（小文件传输的耗时主要在握手上）
+        self._ssh_client: Optional[paramiko.SSHClient] = None
+        self._ssh_client_ip: Optional[str] = None
+        self._ssh_sftp = None  # 随连接一起缓存的SFTP通道
+        # SSH传输线程池（单工作线程，同时串行化对缓存连接的访问）
+        self._ssh_executor = ThreadPoolExecutor(max_workers=1)
         
         # 创建UI
         self.create_ui()
@@ -130,7 +215,14 @@ class CameraCalibrationUI:
             print(f"加载UI配置失败: {e}")
     
     def save_ui_config(self):
+        """保存UI配置（延迟合并写入：短时间内的多次触发只落盘一次）"""
+        if self._save_config_timer is not None:
+            self.root.after_cancel(self._save_config_timer)
+        self._save_config_timer = self.root.after(500, self._save_ui_config_now)
+
+    def _save_ui_config_now(self):
         """保存UI配置（IP地址、棋盘格参数等）"""
+        self._save_config_timer = None
         try:
             config = {
                 'ip_3d': self.ip_3d_var.get().strip(),
@@ -141,7 +233,8 @@ class CameraCalibrationUI:
                 'square_size': self.square_size_var.get().strip()
             }
             with open(UI_CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+                # 一次write整段序列化结果，避免json.dump的逐键小块写
+                f.write(json.dumps(config, indent=2, ensure_ascii=False))
         except Exception as e:
             print(f"保存UI配置失败: {e}")
     
@@ -167,13 +260,13 @@ class CameraCalibrationUI:
         
         # 提取周围区域的深度值
         neighborhood = depth_map[y_min:y_max, x_min:x_max]
-        
-        # 过滤有效深度值（> 0）
-        valid_depths = neighborhood[neighborhood > 0]
-        
-        if len(valid_depths) > 0:
-            # 返回平均值
-            return float(np.mean(valid_depths))
+
+        # 用掩码归约直接求有效深度（> 0）的均值，
+        # 避免 neighborhood[neighborhood > 0] 物化一份压缩拷贝
+        valid_mask = neighborhood > 0
+        valid_count = int(np.count_nonzero(valid_mask))
+        if valid_count > 0:
+            return float(np.sum(neighborhood, where=valid_mask, dtype=np.float64)) / valid_count
         else:
             return 0.0
         
@@ -383,6 +476,9 @@ class CameraCalibrationUI:
         self.canvas_3d.bind("<Button-1>", self.on_canvas_3d_click)
         self.canvas_3d.bind("<B1-Motion>", self.on_canvas_3d_drag)
         self.canvas_3d.bind("<ButtonRelease-1>", self.on_canvas_3d_release)
+        # 缓存画布尺寸，重绘热路径上不再经由Tk C层查询winfo_width/height
+        self.canvas_3d.bind("<Configure>", self._on_canvas_configure, add="+")
+        self.canvas_3d.bind("<Map>", self._on_canvas_map, add="+")
         
         # 3D相机控制区域（分为左右两部分）
         control_3d_frame = ttk.Frame(camera_3d_frame)
@@ -400,7 +496,6 @@ class CameraCalibrationUI:
         ip_3d_entry = ttk.Entry(left_3d_frame, textvariable=self.ip_3d_var, width=18)
         ip_3d_entry.grid(row=0, column=1, sticky=tk.W, padx=(0, 3))
         # 绑定事件，当IP地址改变时自动保存（延迟保存，避免频繁写入）
-        self._save_config_timer = None
         ip_3d_entry.bind("<FocusOut>", lambda e: self.save_ui_config())
         ip_3d_entry.bind("<Return>", lambda e: self.save_ui_config())
         # ttk.Label(left_3d_frame, text="(可带端口，如 169.254.188.22:5000，留空自动搜索)", font=("", 7), foreground="gray").grid(
@@ -425,6 +520,8 @@ class CameraCalibrationUI:
         
         self.canvas_barcode = tk.Canvas(camera_barcode_frame, width=640, height=360, bg="black")
         self.canvas_barcode.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.canvas_barcode.bind("<Configure>", self._on_canvas_configure, add="+")
+        self.canvas_barcode.bind("<Map>", self._on_canvas_map, add="+")
         
         # 读码器相机控制区域（分为左右两部分）
         control_barcode_frame = ttk.Frame(camera_barcode_frame)
@@ -465,17 +562,59 @@ class CameraCalibrationUI:
         self.log("UI初始化完成")
     
     def log(self, message: str):
-        """在状态文本框中添加日志（优化性能，避免频繁UI更新）"""
-        self.status_text.insert(tk.END, f"[{time.strftime('%H:%M:%S')}] {message}\n")
+        """在状态文本框中添加日志（缓冲合批，idle时一次性刷入文本框）"""
+        now = int(time.time())
+        if now != self._last_ts_sec:
+            self._last_ts_sec = now
+            self._last_ts_str = time.strftime('%H:%M:%S', time.localtime(now))
+        self._log_queue.append(f"[{self._last_ts_str}] {message}\n")
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.root.after_idle(self._flush_log)
+
+    def _flush_log(self):
+        """把缓冲的日志一次性写入文本框（每个idle周期只做一次widget更新）"""
+        self._log_flush_scheduled = False
+        if not self._log_queue:
+            return
+        text = ''.join(self._log_queue)
+        self._log_queue.clear()
+        self.status_text.insert(tk.END, text)
+        # 限制回滚行数，避免文本组件的行索引随日志无限增长
+        line_count = int(self.status_text.index('end-1c').split('.')[0])
+        if line_count > 2000:
+            self.status_text.delete('1.0', f'{line_count - 2000}.0')
         self.status_text.see(tk.END)
-        # 移除 update_idletasks()，减少UI更新频率，提高性能
-        # 只在必要时更新（如用户操作时）
-    
+
     def log_with_update(self, message: str):
-        """在状态文本框中添加日志并更新UI（用于重要消息）"""
-        self.status_text.insert(tk.END, f"[{time.strftime('%H:%M:%S')}] {message}\n")
-        self.status_text.see(tk.END)
+        """在状态文本框中添加日志并立即刷新UI（用于重要消息）"""
+        self.log(message)
+        self._flush_log()
         self.root.update_idletasks()
+
+    def _notify(self, title: str, message: str, level: str = "info", modal: bool = False):
+        """汇报操作结果
+
+        检测/标定/转换测试这类会反复执行的流程，成功或一般性警告
+        默认只写日志（对应的状态标签已在流程中更新），不再弹模态框
+        打断连续操作；只有明确要求modal且未开启批量模式时才弹窗。
+
+        Args:
+            title: 对话框标题（仅模态时使用）
+            message: 消息内容
+            level: info/warning/error
+            modal: 是否弹出模态对话框
+        """
+        if modal and not self.batch_mode:
+            if level == "error":
+                messagebox.showerror(title, message)
+            elif level == "warning":
+                messagebox.showwarning(title, message)
+            else:
+                messagebox.showinfo(title, message)
+            return
+        prefix = {"warning": "警告", "error": "错误"}.get(level)
+        self.log(f"[{prefix}] {message}" if prefix else message)
     
     def connect_3d_camera(self):
         """连接3D相机"""
@@ -532,18 +671,9 @@ class CameraCalibrationUI:
             ]
         )
         if file_path:
-            try:
-                image = cv2.imread(file_path)
-                if image is None:
-                    messagebox.showerror("错误", f"无法读取图像文件: {file_path}")
-                    return
-                
-                self.image_3d = image.copy()
-                self.update_display_3d()
-                self.log(f"3D相机图像已加载: {file_path}, 尺寸: {image.shape}")
-            except Exception as e:
-                messagebox.showerror("错误", f"加载图像失败: {e}")
-                self.log(f"加载图像失败: {e}")
+            # 在后台线程中解码，大图（如TIFF）不会卡住UI
+            self.log(f"正在后台加载3D相机图像: {file_path}")
+            self.image_load_executor.submit(self._load_local_image_worker, file_path, True)
     
     def load_local_image_barcode(self):
         """加载本地图像到读码器相机显示区域"""
@@ -557,20 +687,48 @@ class CameraCalibrationUI:
             ]
         )
         if file_path:
-            try:
-                image = cv2.imread(file_path)
-                if image is None:
-                    messagebox.showerror("错误", f"无法读取图像文件: {file_path}")
-                    return
-                
-                self.image_barcode = image.copy()
-                self.update_display_barcode()
-                self.log(f"读码器相机图像已加载: {file_path}, 尺寸: {image.shape}")
-            except Exception as e:
-                messagebox.showerror("错误", f"加载图像失败: {e}")
-                self.log(f"加载图像失败: {e}")
-    
-    
+            # 在后台线程中解码，大图（如TIFF）不会卡住UI
+            self.log(f"正在后台加载读码器相机图像: {file_path}")
+            self.image_load_executor.submit(self._load_local_image_worker, file_path, False)
+
+    def _load_local_image_worker(self, file_path: str, is_3d: bool):
+        """在后台线程中解码本地图像，完成后回到主线程更新显示
+
+        注意：加载的图像会参与标定和坐标转换，必须保持原始分辨率解码，
+        不能用预览尺寸的快速降采样路径。
+        """
+        try:
+            # fromfile + imdecode：直接喂缓冲区给解码器，比imread的C stdio路径更快，
+            # 且不受Windows下中文路径的影响
+            file_buffer = np.fromfile(file_path, dtype=np.uint8)
+            image = cv2.imdecode(file_buffer, cv2.IMREAD_COLOR)
+        except Exception as e:
+            self.root.after(0, self._on_local_image_load_failed, file_path, str(e))
+            return
+
+        if image is None or image.size == 0:
+            self.root.after(0, self._on_local_image_load_failed, file_path, "无法读取图像文件")
+            return
+
+        self.root.after(0, self._on_local_image_loaded, file_path, image, is_3d)
+
+    def _on_local_image_loaded(self, file_path: str, image: np.ndarray, is_3d: bool):
+        """图像加载完成回调（在主线程中执行）"""
+        if is_3d:
+            self.image_3d = image
+            self.update_display_3d()
+            self.log(f"3D相机图像已加载: {file_path}, 尺寸: {image.shape}")
+        else:
+            self.image_barcode = image
+            self.update_display_barcode()
+            self.log(f"读码器相机图像已加载: {file_path}, 尺寸: {image.shape}")
+
+    def _on_local_image_load_failed(self, file_path: str, error_msg: str):
+        """图像加载失败回调（在主线程中执行）"""
+        self.log(f"加载图像失败: {file_path} ({error_msg})")
+        messagebox.showerror("错误", f"加载图像失败: {file_path}\n{error_msg}")
+
+
     def capture_3d_image(self):
         """采集3D相机图像"""
         if self.camera_3d is None:
@@ -613,80 +771,271 @@ class CameraCalibrationUI:
             self.log("读码器相机图像采集失败")
             messagebox.showerror("错误", "读码器相机图像采集失败")
     
+    def _get_marker_style(self, height: int, width: int) -> Tuple[int, int]:
+        """按图像分辨率取点标记的绘制样式（线宽、点半径），同分辨率复用
+
+        Args:
+            height: 图像高度
+            width: 图像宽度
+
+        Returns:
+            Tuple[line_width, point_radius]
+        """
+        style = self._style_cache.get((height, width))
+        if style is not None:
+            return style
+
+        # 基准分辨率1920x1200，线宽/点半径按宽高比例的平均值缩放
+        resolution_ratio = (width / 1920 + height / 1200) / 2
+        base_line_width = 4  # 与之前ROI的线宽一致
+        line_width = max(2, int(base_line_width * resolution_ratio))
+        point_radius = max(5, int(8 * resolution_ratio))
+        style = (line_width, point_radius)
+        self._style_cache[(height, width)] = style
+        return style
+
+    def _get_point_sprite(self, radius: int, color: Tuple[int, int, int]):
+        """取点标记的预渲染贴片（实心圆+白色描边），按(半径, 颜色)缓存
+
+        Args:
+            radius: 实心圆半径
+            color: 实心圆颜色（BGR）
+
+        Returns:
+            Tuple[sprite, mask]: 贴片图像和其非零掩码（供np.copyto的where使用）
+        """
+        key = (radius, color)
+        cached = self._sprite_cache.get(key)
+        if cached is not None:
+            return cached
+        center = radius + 3
+        size = 2 * center + 1
+        sprite = np.zeros((size, size, 3), dtype=np.uint8)
+        cv2.circle(sprite, (center, center), radius, color, -1)
+        cv2.circle(sprite, (center, center), radius + 2, (255, 255, 255), 2)
+        mask = sprite.any(axis=2, keepdims=True)
+        self._sprite_cache[key] = (sprite, mask)
+        return sprite, mask
+
+    def _stamp_sprite(self, img: np.ndarray, sprite: np.ndarray, mask: np.ndarray, x: int, y: int):
+        """把贴片以(x, y)为中心盖到图像上（越界部分自动裁剪）"""
+        center = sprite.shape[0] // 2
+        self._stamp_sprite_topleft(img, sprite, mask, x - center, y - center)
+
+    @staticmethod
+    def _stamp_sprite_topleft(img: np.ndarray, sprite: np.ndarray, mask: np.ndarray, x0: int, y0: int):
+        """把贴片以(x0, y0)为左上角盖到图像上（越界部分自动裁剪）"""
+        h, w = img.shape[:2]
+        ix0, iy0 = max(0, x0), max(0, y0)
+        ix1 = min(w, x0 + sprite.shape[1])
+        iy1 = min(h, y0 + sprite.shape[0])
+        if ix1 <= ix0 or iy1 <= iy0:
+            return
+        sx0, sy0 = ix0 - x0, iy0 - y0
+        np.copyto(
+            img[iy0:iy1, ix0:ix1],
+            sprite[sy0:sy0 + (iy1 - iy0), sx0:sx0 + (ix1 - ix0)],
+            where=mask[sy0:sy0 + (iy1 - iy0), sx0:sx0 + (ix1 - ix0)],
+        )
+
+    def _get_label_sprite(self, label: str, color: Tuple[int, int, int]):
+        """取点标签的预渲染贴片（白色描边+彩色前景），按(标签, 颜色)缓存
+
+        putText会对边缘做抗锯齿混合，不透明贴图无法还原；这里分别在
+        黑底和白底上各渲染一次，推出预乘前景和逆alpha，贴图时按
+        dst = premul + dst * inv_alpha 混合，与直接putText仅差±1舍入。
+
+        Returns:
+            Tuple[premul, inv_alpha, origin]: 预乘前景(float32)、逆alpha(float32)、
+                putText基线原点相对贴片左上角的偏移 (dx, dy)
+        """
+        key = (label, color)
+        cached = self._label_sprite_cache.get(key)
+        if cached is not None:
+            return cached
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        (text_w, text_h), baseline = cv2.getTextSize(label, font, 0.6, 2)
+        # 基线原点放在(2, text_h+2)，四周留白容纳描边
+        origin = (2, text_h + 2)
+        shape = (text_h + baseline + 4, text_w + 4, 3)
+        on_black = np.zeros(shape, dtype=np.uint8)
+        on_white = np.full(shape, 255, dtype=np.uint8)
+        for buf in (on_black, on_white):
+            cv2.putText(buf, label, origin, font, 0.6, (255, 255, 255), 2)
+            cv2.putText(buf, label, origin, font, 0.6, color, 1)
+        premul = on_black.astype(np.float32)
+        inv_alpha = (on_white.astype(np.float32) - premul) / 255.0
+        cached = (premul, inv_alpha, origin)
+        self._label_sprite_cache[key] = cached
+        return cached
+
+    @staticmethod
+    def _blend_label_sprite(img: np.ndarray, premul: np.ndarray, inv_alpha: np.ndarray, x0: int, y0: int):
+        """把预乘alpha的标签贴片混合到图像上（越界部分自动裁剪）"""
+        h, w = img.shape[:2]
+        ix0, iy0 = max(0, x0), max(0, y0)
+        ix1 = min(w, x0 + premul.shape[1])
+        iy1 = min(h, y0 + premul.shape[0])
+        if ix1 <= ix0 or iy1 <= iy0:
+            return
+        sx0, sy0 = ix0 - x0, iy0 - y0
+        roi = img[iy0:iy1, ix0:ix1]
+        sub_premul = premul[sy0:sy0 + (iy1 - iy0), sx0:sx0 + (ix1 - ix0)]
+        sub_inv = inv_alpha[sy0:sy0 + (iy1 - iy0), sx0:sx0 + (ix1 - ix0)]
+        np.copyto(roi, (sub_premul + roi.astype(np.float32) * sub_inv + 0.5).astype(np.uint8))
+
+    def _get_ingest_preview(self, image: np.ndarray, role: str) -> np.ndarray:
+        """取图像的显示用预览
+
+        读码器相机动辄20MP，每次重绘都从原图缩到画布尺寸是主要的
+        显示开销；宽度超过1920的图像在首次显示时缓存一份等比缩小的
+        预览（INTER_AREA），之后的重绘都从预览出发。预览保持原图纵横
+        比，画布点击的坐标换算不受影响。
+
+        Args:
+            image: 原始图像
+            role: 缓存槽位名（'3d' / 'barcode'）
+
+        Returns:
+            np.ndarray: 预览图像（原图不超过1920宽时原样返回）
+        """
+        h, w = image.shape[:2]
+        if w <= 1920:
+            return image
+        cached = self._preview_cache.get(role)
+        if cached is not None and cached[0] is image:
+            return cached[1]
+        preview_h = int(round(h * 1920.0 / w))
+        preview = cv2.resize(image, (1920, preview_h), interpolation=cv2.INTER_AREA)
+        self._preview_cache[role] = (image, preview)
+        return preview
+
     def update_display_3d(self):
-        """更新3D相机图像显示（优化性能）"""
+        """请求更新3D相机图像显示（同一idle周期内的多次请求合并为一次重绘）"""
+        if self._redraw_pending_3d:
+            return
+        self._redraw_pending_3d = True
+        self.root.after_idle(self._do_update_display_3d)
+
+    def _do_update_display_3d(self):
+        """实际执行3D相机图像显示更新（优化性能）"""
+        self._redraw_pending_3d = False
         if self.image_3d is None:
             return
-        
+
+        # 图像和点集都没变时直接复用上次合成好的显示图，
+        # 跳过整帧拷贝和circle/putText/line重绘
+        overlay_key = (id(self.image_3d), tuple(self.selected_points))
+        if overlay_key == self._overlay_3d_key and self.display_image_3d is not None:
+            self._update_canvas(self.canvas_3d, self.display_image_3d, content_changed=False)
+            return
+
         # 检查是否有选中的点需要绘制
         has_points = any(p is not None for p in self.selected_points)
-        
+
         if has_points:
-            # 需要绘制点时创建副本
-            display_img = self.image_3d.copy()
+            # 需要绘制点时复用预分配的显示缓冲区（整帧copy改为copyto，免去每次重绘的分配）
+            if self._display_buffer_3d is None or self._display_buffer_3d.shape != self.image_3d.shape:
+                self._display_buffer_3d = np.empty_like(self.image_3d)
+            display_img = self._display_buffer_3d
+            np.copyto(display_img, self.image_3d)
             
-            # 根据图像分辨率计算点大小和线宽（与分辨率成比例）
+            # 根据图像分辨率取点大小和线宽（与分辨率成比例，同分辨率走缓存）
             h, w = self.image_3d.shape[:2]
-            base_width = 1920
-            base_height = 1200
-            width_ratio = w / base_width
-            height_ratio = h / base_height
-            resolution_ratio = (width_ratio + height_ratio) / 2
-            base_line_width = 4  # 与之前ROI的线宽一致
-            line_width = max(2, int(base_line_width * resolution_ratio))
-            point_radius = max(5, int(8 * resolution_ratio))
-            
-            # 定义四个点的颜色和标签（使用英文简写）
-            point_colors = [(0, 255, 0), (255, 0, 0), (0, 0, 255), (255, 255, 0)]  # 绿、蓝、红、青
-            point_labels = ["TL", "TR", "BL", "BR"]  # Top-Left, Top-Right, Bottom-Left, Bottom-Right
-            
-            # 绘制已选择的点
+            line_width, point_radius = self._get_marker_style(h, w)
+
+            # 四个点的标签（使用英文简写），颜色用构造时预置的数组
+            point_labels = POINT_LABELS
+
+            # 绘制已选择的点（实心圆+白色十字标记，标签用与读码器画布
+            # 相同的预渲染贴片，保持白描边外观）
             valid_points = []
             for i, point in enumerate(self.selected_points):
                 if point is not None:
                     x, y = point
-                    # 绘制点
-                    cv2.circle(display_img, (x, y), point_radius, point_colors[i], -1)
-                    cv2.circle(display_img, (x, y), point_radius + 2, (255, 255, 255), 2)
+                    color = tuple(int(c) for c in self._point_colors[i])
+                    cv2.circle(display_img, (x, y), point_radius, color, -1, cv2.LINE_AA)
+                    cv2.drawMarker(display_img, (x, y), (255, 255, 255),
+                                   cv2.MARKER_CROSS, point_radius * 2, 1, cv2.LINE_AA)
                     # 绘制标签
                     label_pos = (x + point_radius + 5, y - point_radius - 5)
-                    cv2.putText(display_img, point_labels[i], label_pos, 
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
-                    cv2.putText(display_img, point_labels[i], label_pos, 
-                               cv2.FONT_HERSHEY_SIMPLEX, 0.6, point_colors[i], 1)
+                    premul, inv_alpha, origin = self._get_label_sprite(point_labels[i], color)
+                    self._blend_label_sprite(
+                        display_img, premul, inv_alpha,
+                        label_pos[0] - origin[0], label_pos[1] - origin[1],
+                    )
                     valid_points.append((x, y, i))
             
             # 如果至少有两个点，绘制连接线（按顺序：左上->右上->右下->左下->左上）
+            # 一次cv2.polylines画完所有线段，替代逐段cv2.line的Python循环
             if len(valid_points) >= 2:
-                # 按顺序连接点：左上(0) -> 右上(1) -> 右下(3) -> 左下(2) -> 左上(0)
                 point_order = [0, 1, 3, 2]  # 左上、右上、右下、左下
-                points_dict = {i: (x, y) for x, y, i in valid_points}
-                
-                # 绘制连接线
-                for idx in range(len(point_order)):
-                    curr_idx = point_order[idx]
-                    next_idx = point_order[(idx + 1) % len(point_order)]
-                    if curr_idx in points_dict and next_idx in points_dict:
-                        pt1 = points_dict[curr_idx]
-                        pt2 = points_dict[next_idx]
-                        cv2.line(display_img, pt1, pt2, (0, 255, 255), line_width)
+                pts = np.array(
+                    [self.selected_points[i] for i in point_order if self.selected_points[i] is not None],
+                    dtype=np.int32,
+                ).reshape(-1, 1, 2)
+                is_closed = len(pts) == 4  # 四个点齐时闭合成四边形
+                cv2.polylines(display_img, [pts], is_closed, (0, 255, 255), line_width)
             
             self.display_image_3d = display_img
+            self._overlay_3d_key = overlay_key
             self._update_canvas(self.canvas_3d, display_img)
         else:
-            # 没有点时直接使用原图像，避免不必要的复制
-            self.display_image_3d = self.image_3d
-            self._update_canvas(self.canvas_3d, self.image_3d)
+            # 没有点时直接显示预览（超大原图只在入库时缩一次），避免不必要的复制
+            preview = self._get_ingest_preview(self.image_3d, '3d')
+            self.display_image_3d = preview
+            self._overlay_3d_key = overlay_key
+            self._update_canvas(self.canvas_3d, preview)
     
     def update_display_barcode(self):
-        """更新读码器相机图像显示"""
+        """请求更新读码器相机图像显示（合并同一idle周期内的重复请求）"""
+        if self._redraw_pending_barcode:
+            return
+        self._redraw_pending_barcode = True
+        self.root.after_idle(self._do_update_display_barcode)
+
+    def _do_update_display_barcode(self):
+        """实际执行读码器相机图像显示更新"""
+        self._redraw_pending_barcode = False
         if self.image_barcode is None:
             return
-        
-        display_img = self.image_barcode.copy()
+
+        # 不叠加任何标记，直接显示预览，无需整帧拷贝
+        display_img = self._get_ingest_preview(self.image_barcode, 'barcode')
         self.display_image_barcode = display_img
         self._update_canvas(self.canvas_barcode, display_img)
-    
+
+    def _schedule_redraw(self, updates: dict):
+        """合并两个画布的刷新请求，一个idle周期内只执行一次实际重绘
+
+        Args:
+            updates: {'3d'或'barcode': 要显示的图像}，值为None表示走各自的
+                默认显示逻辑（_do_update_display_xxx）
+        """
+        self._pending_redraw.update(updates)
+        if self._redraw_scheduled:
+            return
+        self._redraw_scheduled = True
+        self.root.after_idle(self._flush_redraw)
+
+    def _flush_redraw(self):
+        """一次性刷新所有挂起的画布（连续触发时只保留最后一帧）"""
+        pending, self._pending_redraw = self._pending_redraw, {}
+        self._redraw_scheduled = False
+        if 'barcode' in pending:
+            image = pending['barcode']
+            if image is None:
+                self._do_update_display_barcode()
+            else:
+                self._update_canvas(self.canvas_barcode, image)
+        if '3d' in pending:
+            image = pending['3d']
+            if image is None:
+                self._do_update_display_3d()
+            else:
+                self._update_canvas(self.canvas_3d, image)
+
+
     def _draw_chessboard_corners_custom(self, img: np.ndarray, pattern_size: Tuple[int, int], corners: np.ndarray, is_barcode: bool = False):
         """
         自定义绘制棋盘格角点，使点和线更粗更大
@@ -723,21 +1072,21 @@ class CameraCalibrationUI:
         outline_radius = max(4, outline_radius)
         
         # 只绘制角点，不绘制连接线
+        # 坐标一次性批量取整，循环内不再做逐点的ravel/astype
+        pts = np.rint(corners.reshape(-1, 2)).astype(int)
+        last_idx = len(pts) - 1
+
         # 绘制角点：起点红色，终点绿色，其他点蓝色
-        for idx, corner in enumerate(corners):
-            pt = tuple(corner.ravel().astype(int))
-            
-            # 确定点的颜色
+        for idx in range(len(pts)):
+            pt = (pts[idx, 0], pts[idx, 1])
+
             if idx == 0:
-                # 起点：红色
                 color = (0, 0, 255)  # BGR格式，红色
-            elif idx == len(corners) - 1:
-                # 终点：绿色
+            elif idx == last_idx:
                 color = (0, 255, 0)  # BGR格式，绿色
             else:
-                # 其他点：蓝色
                 color = (255, 0, 0)  # BGR格式，蓝色
-            
+
             # 绘制实心圆（主色）
             cv2.circle(img, pt, point_radius, color, -1)
             # 绘制外圈（白色边框，更清晰）
@@ -746,6 +1095,31 @@ class CameraCalibrationUI:
     def _on_transform_method_changed(self):
         """当转换方法改变时，保持深度输入框可用"""
         self.plane_depth_entry.config(state="normal")
+
+    def _normalize_camera_matrix(self, matrix) -> Optional[np.ndarray]:
+        """
+        把内参矩阵规范化为3x3的float64 numpy数组
+
+        配置里读出来的内参可能是list或9元素的1D数组，规范化结果
+        按源对象记忆，同一份内参反复参与转换时不再重复解析。
+
+        Args:
+            matrix: 内参矩阵（list、1D或3x3的ndarray）
+
+        Returns:
+            np.ndarray: 3x3矩阵，输入为None时返回None
+        """
+        if matrix is None:
+            return None
+        cached = self._intrinsics_cache.get(id(matrix))
+        if cached is not None and cached[0] is matrix:
+            return cached[1]
+        # asarray对已是float64的ndarray不拷贝；下游只读，共享内存安全
+        normalized = np.asarray(matrix, dtype=np.float64)
+        if normalized.ndim == 1:
+            normalized = normalized.reshape(3, 3)
+        self._intrinsics_cache[id(matrix)] = (matrix, normalized)
+        return normalized
     
     def _update_depth_status(self):
         """更新深度图状态显示"""
@@ -754,7 +1128,7 @@ class CameraCalibrationUI:
             self.depth_status_label.config(text=f"已保存 ({w}x{h})", foreground="green")
         else:
             self.depth_status_label.config(text="未保存", foreground="gray")
-    
+
     def capture_depth_map(self):
         """手动采集深度图"""
         if self.camera_3d is None:
@@ -787,59 +1161,114 @@ class CameraCalibrationUI:
             self.log(f"采集深度图时出错: {e}")
             messagebox.showerror("错误", f"采集深度图失败：{e}")
     
-    def _update_canvas(self, canvas: tk.Canvas, image: np.ndarray):
-        """更新画布显示（优化性能，减少不必要的计算）"""
+    def _update_canvas(self, canvas: tk.Canvas, image: np.ndarray, content_changed: bool = True):
+        """更新画布显示（优化性能，减少不必要的计算）
+
+        Args:
+            content_changed: 调用方确定图像内容与上次一致时传False，
+                尺寸也没变的话整条缩放/转换/上传链路直接跳过
+        """
         if image is None:
             return
-        
+
+        # 画布不可见（窗口最小化等）时整条缩放/上传链路都是白做的，
+        # 记下待显示图像，等<Map>事件再补一次重绘
+        if not canvas.winfo_ismapped():
+            canvas._pending_image = image
+            return
+        canvas._pending_image = None
+
         try:
-            # 获取画布尺寸（只在必要时查询）
-            canvas_width = canvas.winfo_width()
-            canvas_height = canvas.winfo_height()
-            
+            # 获取画布尺寸（优先用<Configure>事件缓存的值，避免Tk C层往返）
+            cached_size = getattr(canvas, '_cached_size', None)
+            if cached_size is not None:
+                canvas_width, canvas_height = cached_size
+            else:
+                canvas_width = canvas.winfo_width()
+                canvas_height = canvas.winfo_height()
+
             if canvas_width <= 1 or canvas_height <= 1:
                 canvas_width = 640
                 canvas_height = 360
-            
+
+            # 非连续内存会让下游的resize/cvtColor走慢路径，先整理为连续
+            if not image.flags['C_CONTIGUOUS']:
+                image = np.ascontiguousarray(image)
+
             h, w = image.shape[:2]
             scale = min(canvas_width / w, canvas_height / h)
             new_w = int(w * scale)
             new_h = int(h * scale)
+
+            # 内容没变且几何参数也没变：画布上已是正确像素，整个重绘跳过
+            paint_key = (id(image), w, h, new_w, new_h, canvas_width, canvas_height)
+            if not content_changed and getattr(canvas, '_paint_key', None) == paint_key:
+                return
+
+            # 缩放结果同样写入画布上挂载的复用缓冲区，省去每次重绘的一次整帧分配
+            resize_shape = (new_h, new_w) + image.shape[2:]
+            resize_buffer = getattr(canvas, '_resize_buffer', None)
+            if resize_buffer is None or resize_buffer.shape != resize_shape:
+                resize_buffer = np.empty(resize_shape, dtype=image.dtype)
+                canvas._resize_buffer = resize_buffer
+            # 预览基本都是缩小，INTER_AREA更快且质量更好；偶发放大时退回INTER_LINEAR
+            interpolation = cv2.INTER_AREA if scale < 1 else cv2.INTER_LINEAR
+            resized = cv2.resize(image, (new_w, new_h), dst=resize_buffer, interpolation=interpolation)
             
-            # 只在尺寸变化时进行缩放（简单缓存）
-            if hasattr(canvas, '_last_size') and canvas._last_size == (new_w, new_h, w, h):
-                # 尺寸没变，跳过缩放（但图像内容可能变了，所以还是需要更新）
-                pass
-            
-            resized = cv2.resize(image, (new_w, new_h))
-            canvas._last_size = (new_w, new_h, w, h)
-            
-            # 转换为RGB格式
+            # 转换为RGB格式（复用每个画布上挂载的转换缓冲区，避免每帧分配）
             if len(resized.shape) == 3:
-                resized_rgb = cv2.cvtColor(resized, cv2.COLOR_BGR2RGB)
+                rgb_buffer = getattr(canvas, '_rgb_buffer', None)
+                if rgb_buffer is None or rgb_buffer.shape != resized.shape:
+                    rgb_buffer = np.empty_like(resized)
+                    canvas._rgb_buffer = rgb_buffer
+                cv2.cvtColor(resized, cv2.COLOR_BGR2RGB, dst=rgb_buffer)
+                # frombuffer直接共享转换缓冲区内存，省去fromarray的一次整帧拷贝
+                pil_image = Image.frombuffer('RGB', (new_w, new_h), rgb_buffer, 'raw', 'RGB', 0, 1)
             else:
-                resized_rgb = resized
-            
-            # 转换为PIL Image然后转换为PhotoImage
-            pil_image = Image.fromarray(resized_rgb)
-            photo = ImageTk.PhotoImage(image=pil_image)
-            
-            # 更新画布
-            canvas.delete("all")
-            canvas.create_image(canvas_width // 2, canvas_height // 2, image=photo, anchor=tk.CENTER)
-            canvas.image = photo  # 保持引用
-            
+                # 灰度分支同样走frombuffer零拷贝包装，避免fromarray的整帧复制
+                pil_image = Image.frombuffer('L', (new_w, new_h), resized, 'raw', 'L', 0, 1)
+
+            # 显示尺寸不变时复用已有PhotoImage（paste原地更新像素），
+            # 避免每次刷新都重建PhotoImage和画布项
+            photo_key = (new_w, new_h, canvas_width, canvas_height)
+            if getattr(canvas, '_photo_key', None) == photo_key:
+                canvas._photo.paste(pil_image)
+            else:
+                photo = ImageTk.PhotoImage(image=pil_image)
+                canvas._photo = photo
+                canvas._photo_key = photo_key
+                canvas.delete("all")
+                canvas.create_image(canvas_width // 2, canvas_height // 2, image=photo, anchor=tk.CENTER)
+            canvas.image = canvas._photo  # 保持引用
+            canvas._paint_key = paint_key
+
         except Exception as e:
             print(f"更新画布出错: {e}")
     
+    def _on_canvas_configure(self, event):
+        """画布尺寸变化时更新缓存（挂在画布对象上，供重绘路径直接读取）"""
+        event.widget._cached_size = (event.width, event.height)
+
+    def _on_canvas_map(self, event):
+        """画布重新可见时补绘隐藏期间积攒的最后一帧"""
+        canvas = event.widget
+        pending = getattr(canvas, '_pending_image', None)
+        if pending is not None:
+            canvas._pending_image = None
+            self._update_canvas(canvas, pending)
+
     def on_canvas_3d_click(self, event):
         """3D相机画布点击事件 - 选择四个点"""
         if self.image_3d is None:
             return
         
-        # 将画布坐标转换为图像坐标
-        canvas_width = self.canvas_3d.winfo_width()
-        canvas_height = self.canvas_3d.winfo_height()
+        # 将画布坐标转换为图像坐标（画布尺寸优先读<Configure>缓存）
+        cached_size = getattr(self.canvas_3d, '_cached_size', None)
+        if cached_size is not None:
+            canvas_width, canvas_height = cached_size
+        else:
+            canvas_width = self.canvas_3d.winfo_width()
+            canvas_height = self.canvas_3d.winfo_height()
         if canvas_width <= 1 or canvas_height <= 1:
             return
         
@@ -946,9 +1375,9 @@ class CameraCalibrationUI:
             # 更新状态：检测第一个图像
             self.root.after(0, self._update_detection_status, "正在检测3D相机图像...")
             
-            # 检测3D相机图像中的棋盘格
+            # 检测3D相机图像中的棋盘格（带超时，坏帧不会让检测线程无限运行）
             ret1, corners1 = self.calibration.detect_chessboard(
-                params['image_3d'], params['pattern_size']
+                params['image_3d'], params['pattern_size'], timeout=10.0
             )
             
             if self.detection_cancel_flag.is_set():
@@ -963,9 +1392,9 @@ class CameraCalibrationUI:
             # 更新状态：检测第二个图像
             self.root.after(0, self._update_detection_status, "正在检测读码器相机图像...")
             
-            # 检测读码器相机图像中的棋盘格
+            # 检测读码器相机图像中的棋盘格（带超时）
             ret2, corners2 = self.calibration.detect_chessboard(
-                params['image_barcode'], params['pattern_size']
+                params['image_barcode'], params['pattern_size'], timeout=10.0
             )
             
             if self.detection_cancel_flag.is_set():
@@ -1007,6 +1436,7 @@ class CameraCalibrationUI:
             img1_display = self.image_3d.copy()
             self._draw_chessboard_corners_custom(img1_display, pattern_size, corners1, is_barcode=False)
             self.display_image_3d = img1_display
+            self._overlay_3d_key = None  # 角点图不在点集缓存内，失效以便下次重绘
             self._update_canvas(self.canvas_3d, img1_display)
             self.log(f"3D相机图像: 检测到棋盘格，角点数: {len(corners1)}")
             
@@ -1018,10 +1448,10 @@ class CameraCalibrationUI:
             self.log(f"读码器相机图像: 检测到棋盘格，角点数: {len(corners2)}")
             
             self.log(msg)
-            messagebox.showinfo("成功", f"{msg}\n可以点击'标定外参'进行标定")
+            self._notify("成功", f"{msg}，可以点击'标定外参'进行标定")
         else:
             self.log(f"检测失败: {msg}")
-            messagebox.showwarning("警告", msg)
+            self._notify("警告", msg, level="warning")
     
     def _on_detection_cancelled(self):
         """检测取消回调（在主线程中执行）"""
@@ -1097,11 +1527,9 @@ class CameraCalibrationUI:
         
         # 确保内参矩阵格式正确（在传递给标定函数之前）
         if camera1_matrix is not None:
-            if isinstance(camera1_matrix, list):
-                camera1_matrix = np.array(camera1_matrix, dtype=np.float64)
-            else:
-                camera1_matrix = np.array(camera1_matrix, dtype=np.float64)
-            
+            # asarray对已是float64的ndarray不产生拷贝
+            camera1_matrix = np.asarray(camera1_matrix, dtype=np.float64)
+
             # 如果是1D数组（9个元素），reshape为3x3
             if camera1_matrix.ndim == 1:
                 if len(camera1_matrix) == 9:
@@ -1120,11 +1548,8 @@ class CameraCalibrationUI:
             self.log(f"相机1内参矩阵:\n{camera1_matrix}")
         
         if camera2_matrix is not None:
-            if isinstance(camera2_matrix, list):
-                camera2_matrix = np.array(camera2_matrix, dtype=np.float64)
-            else:
-                camera2_matrix = np.array(camera2_matrix, dtype=np.float64)
-            
+            camera2_matrix = np.asarray(camera2_matrix, dtype=np.float64)
+
             if camera2_matrix.ndim == 1:
                 if len(camera2_matrix) == 9:
                     camera2_matrix = camera2_matrix.reshape(3, 3)
@@ -1206,36 +1631,46 @@ class CameraCalibrationUI:
         if success:
             self.log(f"标定成功: {msg}")
             
-            # 标定成功后，尝试采集并保存深度图
+            # 标定成功后，在后台采集并保存深度图（相机网络往返不再卡住主线程）
             if self.camera_3d and self.image_3d is not None:
-                self.log("标定成功，正在采集深度图...")
-                try:
-                    frame_id = epiceye.trigger_frame(ip=self.camera_3d.ip, pointcloud=True)
-                    if frame_id:
-                        depth_map = self.camera_3d.capture_depth(frame_id)
-                        if depth_map is not None:
-                            self.saved_depth_map = depth_map.copy()
-                            self.log(f"深度图采集成功，尺寸: {depth_map.shape}")
-                            self.log("深度图已保存，测试外参时将优先使用此深度图")
-                            self._update_depth_status()
-                        else:
-                            self.log("深度图采集失败，测试外参时将需要重新采集")
-                            self._update_depth_status()
-                    else:
-                        self.log("无法触发拍摄获取深度图，测试外参时将需要重新采集")
-                        self._update_depth_status()
-                except Exception as e:
-                    self.log(f"采集深度图时出错: {e}，测试外参时将需要重新采集")
-                    self._update_depth_status()
+                self.log("标定成功，正在后台采集深度图...")
+                self._capture_executor.submit(self._capture_depth_worker)
             else:
                 self.log("3D相机未连接，无法采集深度图，测试外参时将需要重新采集")
                 self._update_depth_status()
             
-            messagebox.showinfo("成功", f"外参标定成功！\n{msg}\n可以点击'保存标定参数'保存结果")
+            self._notify("成功", f"外参标定成功！{msg}，可以点击'保存标定参数'保存结果")
         else:
             self.log(f"标定失败: {msg}")
             messagebox.showerror("失败", f"外参标定失败！\n{msg}")
     
+    def _capture_depth_worker(self):
+        """在深度采集线程中触发拍摄并获取深度图，完成后回主线程汇报"""
+        try:
+            frame_id = epiceye.trigger_frame(ip=self.camera_3d.ip, pointcloud=True)
+            if not frame_id:
+                self.root.after(0, self._on_post_calibration_depth, None, "无法触发拍摄获取深度图")
+                return
+            depth_map = self.camera_3d.capture_depth(frame_id)
+            if depth_map is None:
+                self.root.after(0, self._on_post_calibration_depth, None, "深度图采集失败")
+                return
+        except Exception as e:
+            self.root.after(0, self._on_post_calibration_depth, None, f"采集深度图时出错: {e}")
+            return
+
+        self.root.after(0, self._on_post_calibration_depth, depth_map, None)
+
+    def _on_post_calibration_depth(self, depth_map, error_msg):
+        """标定后深度图采集结果回调（在主线程中执行）"""
+        if depth_map is not None:
+            self.saved_depth_map = depth_map.copy()
+            self.log(f"深度图采集成功，尺寸: {depth_map.shape}")
+            self.log("深度图已保存，测试外参时将优先使用此深度图")
+        else:
+            self.log(f"{error_msg}，测试外参时将需要重新采集")
+        self._update_depth_status()
+
     def _on_calibration_error(self, error_msg):
         """标定出错回调（在主线程中执行）"""
         # 清除状态标签
@@ -1258,11 +1693,17 @@ class CameraCalibrationUI:
             if self.calibration.load_calibration(file_path):
                 self.log(f"标定参数加载成功: {file_path}")
                 
-                # 尝试加载关联的深度图
-                depth_file_path = file_path.replace('.json', '_depth.npy')
+                # 尝试加载关联的深度图（优先压缩格式，兼容旧的npy文件）
+                depth_file_path = file_path.replace('.json', '_depth.npz')
+                if not os.path.exists(depth_file_path):
+                    depth_file_path = file_path.replace('.json', '_depth.npy')
                 if os.path.exists(depth_file_path):
                     try:
-                        self.saved_depth_map = np.load(depth_file_path)
+                        if depth_file_path.endswith('.npz'):
+                            with np.load(depth_file_path) as data:
+                                self.saved_depth_map = data['depth']
+                        else:
+                            self.saved_depth_map = np.load(depth_file_path)
                         self.log(f"深度图加载成功: {depth_file_path}, 尺寸: {self.saved_depth_map.shape}")
                         self._update_depth_status()
                     except Exception as e:
@@ -1293,10 +1734,12 @@ class CameraCalibrationUI:
                 self.log(f"标定参数保存成功: {file_path}")
                 
                 # 如果有关联的深度图，也保存深度图
+                # 深度图大片为0且表面平滑，压缩率很高，压缩存储能明显缩小
+                # 磁盘占用和发送到设备的传输量
                 if self.saved_depth_map is not None:
-                    depth_file_path = file_path.replace('.json', '_depth.npy')
+                    depth_file_path = file_path.replace('.json', '_depth.npz')
                     try:
-                        np.save(depth_file_path, self.saved_depth_map)
+                        np.savez_compressed(depth_file_path, depth=self.saved_depth_map)
                         self.log(f"深度图保存成功: {depth_file_path}")
                     except Exception as e:
                         self.log(f"深度图保存失败: {e}")
@@ -1327,6 +1770,68 @@ class CameraCalibrationUI:
     def _get_device_path(self, file_name: str) -> str:
         return f"{DEVICE_BASE_DIR}/{file_name}"
 
+    def _get_ssh_client(self, ip: str) -> paramiko.SSHClient:
+        """获取到设备的SSH连接（按IP复用，连接断开时自动重建）
+
+        每次上传/下载都重新握手的话，TCP+SSH握手会占掉绝大部分耗时；
+        这里保持连接、开启keepalive，后续传输只剩传输本身。
+        """
+        client = self._ssh_client
+        if client is not None and self._ssh_client_ip == ip:
+            transport = client.get_transport()
+            if transport is not None and transport.is_active():
+                return client
+            self._close_ssh_client()
+
+        # 可能在SSH工作线程中被调用，日志经由主线程
+        self.root.after(0, self.log, f"正在连接设备: {ip}:{DEVICE_PORT}")
+        client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        client.connect(
+            ip,
+            port=DEVICE_PORT,
+            username=DEVICE_USERNAME,
+            password=DEVICE_PASSWORD,
+            timeout=10,
+            compress=True,
+            allow_agent=False,
+            look_for_keys=False,
+        )
+        client.get_transport().set_keepalive(30)
+        self._ssh_client = client
+        self._ssh_client_ip = ip
+        return client
+
+    def _get_sftp(self, ip: str) -> paramiko.SFTPClient:
+        """获取到设备的SFTP通道（随SSH连接一起缓存）
+
+        SFTP子系统的建立也有一次往返开销，连接复用时通道同样复用；
+        通道失效（随连接断开）时由_get_ssh_client重建连接后再开新通道。
+        """
+        client = self._get_ssh_client(ip)
+        if self._ssh_sftp is not None and self._ssh_client is client:
+            channel = self._ssh_sftp.get_channel()
+            if channel is not None and not channel.closed:
+                return self._ssh_sftp
+        self._ssh_sftp = client.open_sftp()
+        return self._ssh_sftp
+
+    def _close_ssh_client(self):
+        """关闭并丢弃缓存的SSH连接（连带SFTP通道）"""
+        if self._ssh_sftp is not None:
+            try:
+                self._ssh_sftp.close()
+            except Exception:
+                pass
+            self._ssh_sftp = None
+        if self._ssh_client is not None:
+            try:
+                self._ssh_client.close()
+            except Exception:
+                pass
+            self._ssh_client = None
+            self._ssh_client_ip = None
+
     def send_calibration_to_device(self):
         """发送标定参数到设备"""
         ip = self._get_device_ip()
@@ -1360,39 +1865,11 @@ class CameraCalibrationUI:
                 messagebox.showerror("失败", "保存配置文件失败，无法发送到设备")
                 return
         
-        client = None
-        sftp = None
-        try:
-            self.log(f"正在连接设备: {ip}:{DEVICE_PORT}")
-            client = paramiko.SSHClient()
-            client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            client.connect(
-                ip,
-                port=DEVICE_PORT,
-                username=DEVICE_USERNAME,
-                password=DEVICE_PASSWORD,
-                timeout=10
-            )
-            sftp = client.open_sftp()
-            
-            # 确保目标目录存在
-            try:
-                sftp.stat(DEVICE_BASE_DIR)
-            except Exception:
-                self.log(f"设备路径不存在，尝试创建: {DEVICE_BASE_DIR}")
-                sftp.mkdir(DEVICE_BASE_DIR)
-            
-            sftp.put(local_path, remote_path)
-            self.log(f"配置文件已发送: {remote_path}")
-            messagebox.showinfo("成功", "配置文件已发送到设备")
-        except Exception as e:
-            self.log(f"发送配置文件失败: {e}")
-            messagebox.showerror("失败", f"发送配置文件失败: {e}")
-        finally:
-            if sftp is not None:
-                sftp.close()
-            if client is not None:
-                client.close()
+        # 在后台线程中执行传输，SSH往返不会卡住Tk事件循环
+        self.log(f"正在后台上传配置文件: {remote_path}")
+        self._ssh_executor.submit(
+            self._transfer_calibration_worker, ip, local_path, remote_path, True
+        )
 
     def receive_calibration_from_device(self):
         """从设备接收标定参数"""
@@ -1417,37 +1894,51 @@ class CameraCalibrationUI:
         
         file_name = os.path.basename(local_path)
         remote_path = self._get_device_path(file_name)
-        client = None
-        sftp = None
+        # 在后台线程中执行传输，SSH往返不会卡住Tk事件循环
+        self.log(f"正在后台下载配置文件: {remote_path}")
+        self._ssh_executor.submit(
+            self._transfer_calibration_worker, ip, local_path, remote_path, False
+        )
+
+    def _transfer_calibration_worker(self, ip: str, local_path: str, remote_path: str, is_upload: bool):
+        """在SSH工作线程中执行上传/下载，完成后回主线程汇报"""
         try:
-            self.log(f"正在连接设备: {ip}:{DEVICE_PORT}")
-            client = paramiko.SSHClient()
-            client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            client.connect(
-                ip,
-                port=DEVICE_PORT,
-                username=DEVICE_USERNAME,
-                password=DEVICE_PASSWORD,
-                timeout=10
-            )
-            sftp = client.open_sftp()
-            sftp.get(remote_path, local_path)
+            sftp = self._get_sftp(ip)
+            if is_upload:
+                # 确保目标目录存在
+                try:
+                    sftp.stat(DEVICE_BASE_DIR)
+                except Exception:
+                    self.root.after(0, self.log, f"设备路径不存在，尝试创建: {DEVICE_BASE_DIR}")
+                    sftp.mkdir(DEVICE_BASE_DIR)
+                sftp.put(local_path, remote_path)
+            else:
+                sftp.get(remote_path, local_path)
+        except Exception as e:
+            self._close_ssh_client()  # 连接可能已失效，下次重建
+            self.root.after(0, self._on_transfer_failed, str(e), is_upload)
+            return
+
+        self.root.after(0, self._on_transfer_complete, local_path, remote_path, is_upload)
+
+    def _on_transfer_complete(self, local_path: str, remote_path: str, is_upload: bool):
+        """传输完成回调（在主线程中执行）"""
+        if is_upload:
+            self.log(f"配置文件已发送: {remote_path}")
+            messagebox.showinfo("成功", "配置文件已发送到设备")
+        else:
             self.log(f"配置文件已接收: {local_path}")
-            
             if self.calibration.load_calibration(local_path):
                 self.log("标定参数已加载到当前UI")
             else:
                 self.log("标定参数加载失败")
-            
             messagebox.showinfo("成功", "已从设备接收配置文件")
-        except Exception as e:
-            self.log(f"接收配置文件失败: {e}")
-            messagebox.showerror("失败", f"接收配置文件失败: {e}")
-        finally:
-            if sftp is not None:
-                sftp.close()
-            if client is not None:
-                client.close()
+
+    def _on_transfer_failed(self, error_msg: str, is_upload: bool):
+        """传输失败回调（在主线程中执行）"""
+        action = "发送" if is_upload else "接收"
+        self.log(f"{action}配置文件失败: {error_msg}")
+        messagebox.showerror("失败", f"{action}配置文件失败: {error_msg}")
     
     def show_3d_camera_intrinsics(self):
         """显示3D相机内参"""
@@ -1463,10 +1954,7 @@ class CameraCalibrationUI:
             return
         
         # 转换为numpy数组
-        if isinstance(camera_matrix, list):
-            camera_matrix = np.array(camera_matrix)
-        if camera_matrix.ndim == 1:
-            camera_matrix = camera_matrix.reshape(3, 3)
+        camera_matrix = self._normalize_camera_matrix(camera_matrix)
         
         # 构建显示信息
         info_text = "=" * 50 + "\n"
@@ -1573,10 +2061,7 @@ class CameraCalibrationUI:
                 self.log("使用标定时保存的读码器相机内参")
                 
                 # 验证保存的内参是否合理
-                if isinstance(camera2_matrix, list):
-                    camera2_matrix = np.array(camera2_matrix, dtype=np.float64)
-                if camera2_matrix.ndim == 1:
-                    camera2_matrix = camera2_matrix.reshape(3, 3)
+                camera2_matrix = self._normalize_camera_matrix(camera2_matrix)
                 
                 h2, w2 = self.image_barcode.shape[:2]
                 fx = camera2_matrix[0, 0]
@@ -1604,15 +2089,8 @@ class CameraCalibrationUI:
                 camera2_distortion = np.zeros(4)
         
         # 确保内参矩阵格式正确
-        if isinstance(camera1_matrix, list):
-            camera1_matrix = np.array(camera1_matrix, dtype=np.float64)
-        if camera1_matrix.ndim == 1:
-            camera1_matrix = camera1_matrix.reshape(3, 3)
-        
-        if isinstance(camera2_matrix, list):
-            camera2_matrix = np.array(camera2_matrix, dtype=np.float64)
-        if camera2_matrix.ndim == 1:
-            camera2_matrix = camera2_matrix.reshape(3, 3)
+        camera1_matrix = self._normalize_camera_matrix(camera1_matrix)
+        camera2_matrix = self._normalize_camera_matrix(camera2_matrix)
         
         # 优先尝试使用2D平面转换（无需深度图）
         # 如果ROI在一个平面上，可以使用单应性矩阵进行转换
@@ -1634,7 +2112,10 @@ class CameraCalibrationUI:
             h_saved, w_saved = self.saved_depth_map.shape[:2]
             h_img, w_img = self.image_3d.shape[:2]
             if h_saved == h_img and w_saved == w_img:
-                depth_map = self.saved_depth_map.copy()
+                # 转换过程只读取深度值，用只读视图代替整图拷贝
+                # （saved_depth_map只会被整体重新赋值，不存在原地修改，别名安全）
+                depth_map = self.saved_depth_map.view()
+                depth_map.flags.writeable = False
                 self.depth_map = depth_map
                 self.log(f"使用保存的深度图，尺寸: {depth_map.shape}")
             else:
@@ -1652,20 +2133,25 @@ class CameraCalibrationUI:
                         self.depth_map = depth_map
                         self.log(f"深度图采集成功，尺寸: {depth_map.shape}")
                         # 如果有深度图，计算四个点的平均深度用于平面转换（作为参考）
-                        valid_depths = []
-                        for point in self.selected_points:
-                            if point is not None:
-                                x, y = point
-                                if 0 <= y < depth_map.shape[0] and 0 <= x < depth_map.shape[1]:
-                                    depth = depth_map[y, x]
-                                    if depth > 0:
-                                        valid_depths.append(depth)
+                        # 一次fancy indexing批量采样所有已选点，越界和无效值用掩码过滤
+                        pts = np.array(
+                            [p for p in self.selected_points if p is not None], dtype=np.int64
+                        ).reshape(-1, 2)
+                        in_bounds = (
+                            (pts[:, 0] >= 0) & (pts[:, 0] < depth_map.shape[1])
+                            & (pts[:, 1] >= 0) & (pts[:, 1] < depth_map.shape[0])
+                        )
+                        pts = pts[in_bounds]
+                        depths = depth_map[pts[:, 1], pts[:, 0]] if len(pts) else np.empty(0)
+                        valid_depths = depths[depths > 0]
                         if len(valid_depths) > 0:
+                            # 统计量在一份float64数组上就地计算，避免反复的类型转换
+                            arr = np.asarray(valid_depths, dtype=np.float64)
                             # 使用四个点的平均深度（作为参考）
-                            plane_depth = float(np.mean(valid_depths))
-                            self.log(f"四个点平均深度: {plane_depth:.2f}mm (范围: {np.min(valid_depths):.2f} - {np.max(valid_depths):.2f}mm)")
+                            plane_depth = float(arr.mean())
+                            self.log(f"四个点平均深度: {plane_depth:.2f}mm (范围: {arr.min():.2f} - {arr.max():.2f}mm)")
                             # 检查深度值的一致性
-                            depth_std = np.std(valid_depths)
+                            depth_std = float(arr.std())
                             if depth_std > 50:  # 如果标准差超过50mm，说明深度不一致
                                 self.log(f"警告: 四个点深度差异较大（标准差: {depth_std:.2f}mm），建议使用3D转换方法")
                         else:
@@ -1680,8 +2166,8 @@ class CameraCalibrationUI:
             self.log("3D相机未连接，无法获取深度值，将使用3D转换方法（需要估算深度）")
         
         # 转换四个点
-        point_labels = ["TL", "TR", "BL", "BR"]  # Top-Left, Top-Right, Bottom-Left, Bottom-Right
-        point_labels_cn = ["左上", "右上", "左下", "右下"]  # 用于日志显示
+        point_labels = POINT_LABELS
+        point_labels_cn = POINT_LABELS_CN
         self.log(f"开始转换四个点:")
         for i, point in enumerate(self.selected_points):
             if point is not None:
@@ -1736,35 +2222,31 @@ class CameraCalibrationUI:
                 messagebox.showerror("错误", "计算单应性矩阵失败")
                 return
             
-            # 转换四个点
-            for i, point in enumerate(self.selected_points):
-                if point is not None:
-                    x, y = point
-                    # 转换为齐次坐标
-                    point_homo = np.array([x, y, 1.0], dtype=np.float32)
-                    # 应用单应性矩阵
-                    transformed_homo = H @ point_homo
-                    if abs(transformed_homo[2]) < 1e-6:
+            # 一次cv2.perspectiveTransform批量转换所有已选点（替代逐点应用H）
+            valid_indices = [i for i, p in enumerate(self.selected_points) if p is not None]
+            transformed_points_list = [None, None, None, None]
+            if valid_indices:
+                pts = np.array(
+                    [self.selected_points[i] for i in valid_indices], dtype=np.float32
+                ).reshape(-1, 1, 2)
+                dst_pts = cv2.perspectiveTransform(pts, H)
+                # perspectiveTransform把w≈0的退化点悄悄映射到(0,0)，
+                # 所以齐次第三分量要自己批量算一遍再过滤
+                w_homo = pts.reshape(-1, 2).astype(np.float64) @ H[2, :2] + H[2, 2]
+                for j, i in enumerate(valid_indices):
+                    if abs(w_homo[j]) < 1e-6:
                         self.log(f"警告: {point_labels_cn[i]}转换后齐次坐标第三分量接近0")
-                        transformed_points_list.append(None)
-                    else:
-                        transformed_point = (transformed_homo[0] / transformed_homo[2], 
-                                           transformed_homo[1] / transformed_homo[2])
-                        transformed_points_list.append(transformed_point)
-                        self.log(f"  {point_labels_cn[i]}: ({x}, {y}) -> ({transformed_point[0]:.2f}, {transformed_point[1]:.2f})")
-                else:
-                    transformed_points_list.append(None)
+                        continue
+                    tx, ty = float(dst_pts[j, 0, 0]), float(dst_pts[j, 0, 1])
+                    x, y = self.selected_points[i]
+                    transformed_points_list[i] = (tx, ty)
+                    self.log(f"  {point_labels_cn[i]}: ({x}, {y}) -> ({tx:.2f}, {ty:.2f})")
         else:
             # 使用3D转换（需要深度图）
+            constant_depth = None  # UI输入深度时走标量路径，不合成整图深度
             if depth_map is None:
                 if not ui_plane_depth_str:
-                    messagebox.showerror(
-                        "错误",
-                        "无法进行3D坐标转换：\n\n"
-                        "1. 未获取深度图\n"
-                        "2. 未输入深度值\n\n"
-                        "请在UI中输入深度值（mm）后重试，或连接3D相机获取深度图。"
-                    )
+                    messagebox.showerror("错误", ERROR_MSGS["no_depth_no_input"])
                     self.log("错误: 没有深度图且未输入深度值，无法进行3D转换")
                     return
                 try:
@@ -1772,72 +2254,87 @@ class CameraCalibrationUI:
                     if estimated_depth <= 0:
                         raise ValueError()
                 except ValueError:
-                    messagebox.showerror(
-                        "错误",
-                        "深度值格式错误或小于等于0，请输入有效的深度值（mm）。"
-                    )
+                    messagebox.showerror("错误", ERROR_MSGS["invalid_depth"])
                     self.log("错误: UI输入的深度值无效，无法进行3D转换")
                     return
 
                 if self.image_3d is not None:
-                    h_img, w_img = self.image_3d.shape[:2]
-                    depth_map = np.ones((h_img, w_img), dtype=np.float32) * estimated_depth
+                    # 标量深度对所有点一致，不必为取4个值分配一张整图
+                    constant_depth = estimated_depth
                     self.log(f"无深度图，使用UI输入深度: {estimated_depth:.2f}mm 进行3D转换")
                 else:
-                    messagebox.showerror(
-                        "错误",
-                        "无法进行坐标转换：\n\n"
-                        "1. 3D相机未连接，无法获取深度值\n"
-                        "2. 没有加载3D相机图像\n\n"
-                        "请连接3D相机并获取深度图，或加载3D相机图像后输入深度值。"
-                    )
+                    messagebox.showerror("错误", ERROR_MSGS["no_3d_image"])
                     return
             
             self.log("使用3D转换方法（基于深度图）")
-            # 转换四个点
-            for i, point in enumerate(self.selected_points):
-                if point is not None:
-                    x, y = point
-                    # 获取该点的深度
-                    if 0 <= y < depth_map.shape[0] and 0 <= x < depth_map.shape[1]:
-                        depth = depth_map[y, x]
-                        
-                        # 如果深度无效，尝试使用周围区域的有效深度值
-                        if depth <= 0:
-                            depth = self._get_depth_from_neighborhood(depth_map, x, y, search_radius=5)
-                            if depth > 0:
-                                self.log(f"  {point_labels_cn[i]}: 点({x}, {y})深度无效，使用周围区域平均深度: {depth:.2f}mm")
-                        
+            # 第一遍：收集各点的有效深度（保留逐点的无效深度提示）
+            depth_shape = depth_map.shape if depth_map is not None else self.image_3d.shape[:2]
+            transformed_points_list = [None, None, None, None]
+            batch_indices = []
+            batch_points = []
+            batch_depths = []
+            point_indices = [i for i, p in enumerate(self.selected_points) if p is not None]
+            if point_indices:
+                # 越界掩码和深度取值一次向量化算完，循环里只剩日志和邻域回退
+                pts = np.array([self.selected_points[i] for i in point_indices], dtype=np.int64)
+                xs, ys = pts[:, 0], pts[:, 1]
+                map_h, map_w = depth_shape
+                in_bounds = (xs >= 0) & (xs < map_w) & (ys >= 0) & (ys < map_h)
+                if constant_depth is not None:
+                    gathered = np.where(in_bounds, constant_depth, -1.0)
+                else:
+                    gathered = np.where(
+                        in_bounds,
+                        depth_map[ys.clip(0, map_h - 1), xs.clip(0, map_w - 1)],
+                        -1.0,
+                    )
+                for j, i in enumerate(point_indices):
+                    x, y = int(xs[j]), int(ys[j])
+                    if not in_bounds[j]:
+                        self.log(f"  {point_labels_cn[i]}: 坐标超出深度图范围")
+                        continue
+                    depth = float(gathered[j])
+
+                    # 如果深度无效，尝试使用周围区域的有效深度值（标量深度恒有效）
+                    if constant_depth is None and depth <= 0:
+                        depth = self._get_depth_from_neighborhood(depth_map, x, y, search_radius=5)
                         if depth > 0:
-                            # 使用3D转换方法
-                            transformed_point = self.calibration.transform_point_with_projectpoints(
-                                np.array([x, y], dtype=np.float32),
-                                camera1_matrix,
-                                camera2_matrix,
-                                camera1_distortion,
-                                camera2_distortion,
-                                depth
-                            )
-                            if transformed_point is not None:
-                                transformed_points_list.append((float(transformed_point[0]), float(transformed_point[1])))
-                                self.log(f"  {point_labels_cn[i]}: ({x}, {y}), 深度={depth:.2f}mm -> ({transformed_point[0]:.2f}, {transformed_point[1]:.2f})")
-                            else:
-                                transformed_points_list.append(None)
-                                self.log(f"  {point_labels_cn[i]}: 转换失败")
+                            self.log(f"  {point_labels_cn[i]}: 点({x}, {y})深度无效，使用周围区域平均深度: {depth:.2f}mm")
+
+                    if depth <= 0:
+                        self.log(f"  {point_labels_cn[i]}: 深度值无效 ({depth:.2f}mm)，周围区域也无有效深度值")
+                        continue
+
+                    batch_indices.append(i)
+                    batch_points.append((x, y))
+                    batch_depths.append(float(depth))
+
+            # 第二遍：所有有效点一次批量undistort/projectPoints转换
+            if batch_indices:
+                batch_results = self.calibration.transform_points_batch(
+                    np.array(batch_points, dtype=np.float32),
+                    camera1_matrix,
+                    camera2_matrix,
+                    camera1_distortion,
+                    camera2_distortion,
+                    np.array(batch_depths, dtype=np.float32),
+                )
+                if batch_results is not None:
+                    for j, i in enumerate(batch_indices):
+                        transformed_point = batch_results[j]
+                        x, y = batch_points[j]
+                        if transformed_point is not None:
+                            transformed_points_list[i] = (float(transformed_point[0]), float(transformed_point[1]))
+                            self.log(f"  {point_labels_cn[i]}: ({x}, {y}), 深度={batch_depths[j]:.2f}mm -> ({transformed_point[0]:.2f}, {transformed_point[1]:.2f})")
                         else:
-                            transformed_points_list.append(None)
-                            self.log(f"  {point_labels_cn[i]}: 深度值无效 ({depth:.2f}mm)，周围区域也无有效深度值")
-                    else:
-                        transformed_points_list.append(None)
-                        self.log(f"  {point_labels_cn[i]}: 坐标超出深度图范围")
+                            self.log(f"  {point_labels_cn[i]}: 转换失败")
                 else:
-                    transformed_points_list.append(None)
+                    self.log("批量坐标转换失败，请查看终端输出获取详细错误信息")
         
         # 检查转换结果
         valid_transformed_points = [p for p in transformed_points_list if p is not None]
         if len(valid_transformed_points) < 2:
-            error_msg = "坐标转换失败\n\n可能原因：\n1. 深度图无效\n2. 某些点的深度值无效\n3. 转换后的点在相机后方\n4. 有效转换点不足（需要至少2个）\n\n请查看终端输出获取详细错误信息"
-            messagebox.showerror("错误", error_msg)
+            messagebox.showerror("错误", ERROR_MSGS["transform_failed"])
             self.log("坐标转换失败，请查看终端输出获取详细错误信息")
             return
         
@@ -1845,57 +2342,55 @@ class CameraCalibrationUI:
         self.log(f"成功转换了{len(valid_transformed_points)}个点")
         
         # 在读码器图像上绘制转换后的四个点和连接线
-        img_barcode_display = self.image_barcode.copy()
+        # 复用预分配的显示缓冲区（整帧copy改为copyto，免去每次点击的大块分配）
+        if self._display_buffer_barcode is None or self._display_buffer_barcode.shape != self.image_barcode.shape:
+            self._display_buffer_barcode = np.empty_like(self.image_barcode)
+        img_barcode_display = self._display_buffer_barcode
+        np.copyto(img_barcode_display, self.image_barcode)
         
-        # 根据图像分辨率计算点大小和线宽（与分辨率成比例）
+        # 根据图像分辨率取点大小和线宽（与分辨率成比例，同分辨率走缓存）
         h_img, w_img = self.image_barcode.shape[:2]
-        base_width = 1920
-        base_height = 1200
-        width_ratio = w_img / base_width
-        height_ratio = h_img / base_height
-        resolution_ratio = (width_ratio + height_ratio) / 2
-        base_line_width = 4  # 与之前ROI的线宽一致
-        line_width = max(2, int(base_line_width * resolution_ratio))
-        point_radius = max(5, int(8 * resolution_ratio))
+        line_width, point_radius = self._get_marker_style(h_img, w_img)
         
-        # 定义四个点的颜色和标签（使用英文简写）
-        point_colors = [(0, 255, 0), (255, 0, 0), (0, 0, 255), (255, 255, 0)]  # 绿、蓝、红、青
-        
-        # 绘制转换后的点
+        # 有效点一次性转数组并批量裁剪到图像范围内（代替逐点的int/min/max）
+        valid_indices = [i for i, p in enumerate(transformed_points_list) if p is not None]
         valid_points_dict = {}
-        for i, transformed_point in enumerate(transformed_points_list):
-            if transformed_point is not None:
-                x, y = int(transformed_point[0]), int(transformed_point[1])
-                # 确保点在图像范围内
-                x = max(0, min(x, w_img - 1))
-                y = max(0, min(y, h_img - 1))
-                # 绘制点
-                cv2.circle(img_barcode_display, (x, y), point_radius, point_colors[i], -1)
-                cv2.circle(img_barcode_display, (x, y), point_radius + 2, (255, 255, 255), 2)
-                # 绘制标签
+        if valid_indices:
+            pts = np.array(
+                [transformed_points_list[i] for i in valid_indices], dtype=np.float32
+            )
+            clipped = np.clip(pts, 0, np.array([w_img - 1, h_img - 1], dtype=np.float32)).astype(np.int32)
+
+            # 绘制转换后的点
+            for j, i in enumerate(valid_indices):
+                x, y = int(clipped[j, 0]), int(clipped[j, 1])
+                # 绘制点（预渲染贴片一次盖上，代替每点两次全图circle调用）
+                sprite, sprite_mask = self._get_point_sprite(point_radius, POINT_COLORS[i])
+                self._stamp_sprite(img_barcode_display, sprite, sprite_mask, x, y)
+                # 绘制标签（文本贴片同样只光栅化一次，免去每点两次putText）
                 label_pos = (x + point_radius + 5, y - point_radius - 5)
-                cv2.putText(img_barcode_display, point_labels[i], label_pos, 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
-                cv2.putText(img_barcode_display, point_labels[i], label_pos, 
-                           cv2.FONT_HERSHEY_SIMPLEX, 0.6, point_colors[i], 1)
+                premul, inv_alpha, origin = self._get_label_sprite(point_labels[i], POINT_COLORS[i])
+                self._blend_label_sprite(
+                    img_barcode_display, premul, inv_alpha,
+                    label_pos[0] - origin[0], label_pos[1] - origin[1],
+                )
                 valid_points_dict[i] = (x, y)
         
         # 绘制连接线（按顺序：左上->右上->右下->左下->左上）
+        # 一次cv2.polylines画完所有线段，与3D侧的画法一致
         if len(valid_points_dict) >= 2:
             point_order = [0, 1, 3, 2]  # 左上、右上、右下、左下
-            for idx in range(len(point_order)):
-                curr_idx = point_order[idx]
-                next_idx = point_order[(idx + 1) % len(point_order)]
-                if curr_idx in valid_points_dict and next_idx in valid_points_dict:
-                    pt1 = valid_points_dict[curr_idx]
-                    pt2 = valid_points_dict[next_idx]
-                    cv2.line(img_barcode_display, pt1, pt2, (0, 255, 255), line_width)
+            pts = np.array(
+                [valid_points_dict[i] for i in point_order if i in valid_points_dict],
+                dtype=np.int32,
+            ).reshape(-1, 1, 2)
+            is_closed = len(pts) == 4  # 四个点齐时闭合成四边形
+            cv2.polylines(img_barcode_display, [pts], is_closed, (0, 255, 255), line_width)
         
         self.display_image_barcode = img_barcode_display
-        self._update_canvas(self.canvas_barcode, img_barcode_display)
-        
-        # 在3D相机图像上保持点显示
-        self.update_display_3d()
+        # 读码器标注图和3D画布的点显示合并到同一次idle刷新，
+        # 连续触发转换时两个画布各只重绘一次
+        self._schedule_redraw({'barcode': img_barcode_display, '3d': None})
         
         # 构建成功消息
         points_info = "\n".join([
@@ -1903,10 +2398,10 @@ class CameraCalibrationUI:
             for i in range(4) if self.selected_points[i] is not None
         ])
         
-        messagebox.showinfo("成功", 
-            f"坐标转换成功！\n\n"
-            f"转换结果:\n{points_info}\n\n"
-            f"转换后的点已显示在读码器图像上")
+        self._notify(
+            "成功",
+            f"坐标转换成功！\n转换结果:\n{points_info}\n转换后的点已显示在读码器图像上",
+        )
 
 
 def main():